@@ -1,35 +1,95 @@
 import argparse
 import csv
+import json
 import logging
 import os
 import re
+import sqlite3
 import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Iterable, List, Optional
-from urllib.parse import urljoin, quote
+from operator import itemgetter
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+from urllib.parse import parse_qs, quote, urlencode, urljoin, urlparse, urlunparse
 
 import requests
-from bs4 import BeautifulSoup, Tag
+from requests.adapters import HTTPAdapter
+from lxml import etree
+from lxml import html as lxml_html
+from lxml.cssselect import CSSSelector
+from lxml.html import HtmlElement
+from urllib3.util.retry import Retry
 
 
 BASE_URL = "https://students.yale.edu"
 
-COLLEGE_NAMES = {
+FIELDNAMES = ["name","college","class_year","major","bio","source_url","scraped_at"]
+# Record dict -> CSV row tuple in FIELDNAMES order (plain csv.writer is cheaper than DictWriter)
+_record_row = itemgetter(*FIELDNAMES)
+
+# Retry policy for every request: backoff on 429/5xx and connection errors happens inside
+# urllib3 on the thread that made the request, honoring the server's Retry-After when sent.
+HTTP_RETRY = Retry(
+    total=3,
+    backoff_factor=1.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=("GET",),
+    respect_retry_after_header=True,
+)
+
+# Rows are streamed to the CSV as pages are parsed; flush to disk every N pages.
+FLUSH_EVERY_PAGES = 5
+
+# Pages are fed to the streaming HTML parser in chunks of this many characters.
+FEED_CHUNK_SIZE = 64 * 1024
+
+COLLEGE_NAMES = frozenset(sys.intern(name) for name in (
     "Benjamin Franklin College", "Berkeley College", "Branford College",
     "Davenport College", "Ezra Stiles College", "Grace Hopper College",
     "Jonathan Edwards College", "Morse College", "Pauli Murray College",
     "Pierson College", "Saybrook College", "Silliman College",
     "Timothy Dwight College", "Trumbull College", "Yale College",
-}
+))
+
+MAJOR_KEYWORDS_LIST = (
+    "engineering", "science", "studies", "econom", "biology", "bio", "math", "mathematics", "history", "english",
+    "psychology", "sociology", "philosophy", "political", "global", "chemical", "electrical", "mechanical", "civil",
+    "applied", "neuro", "physics", "chemistry", "art", "architecture", "music", "theater", "theatre", "film", "media", "stat",
+    "statistics", "computer", r"cs\b", "finance", "anthropology", "linguistics", "literature", "german", "french", "spanish",
+    "italian", "portuguese", "russian", "slav", "judaic", "hebrew", "korean", "japanese", "chinese", "latin", "greek", "classics",
+    "environment", "earth", "geology", "astronomy", "religion", "history of", "east", "afric", "american", "asian",
+)
 
+# Only search() hits matter, so a keyword containing a shorter one ("biology" vs "bio",
+# "earth" vs "art") can never change the result; leaving those out keeps the alternation small.
 MAJOR_KEYWORDS = re.compile(
-    r"(?i)(engineering|science|studies|econom|biology|bio|math|mathematics|history|english|"
-    r"psychology|sociology|philosophy|political|global|chemical|electrical|mechanical|civil|"
-    r"applied|neuro|physics|chemistry|art|architecture|music|theater|theatre|film|media|stat|"
-    r"statistics|computer|cs\b|finance|anthropology|linguistics|literature|german|french|spanish|"
-    r"italian|portuguese|russian|slav|judaic|hebrew|korean|japanese|chinese|latin|greek|classics|"
-    r"environment|earth|geology|astronomy|religion|history of|east|afric|american|asian)"
+    "|".join(kw for kw in MAJOR_KEYWORDS_LIST if not any(o != kw and o in kw for o in MAJOR_KEYWORDS_LIST)),
+    re.IGNORECASE,
+)
+
+MONTHS = frozenset({"Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"})
+
+# Lines shorter than this are interned, so repeated college/major lines share one string
+# and COLLEGE_NAMES lookups hit on identity; longer (address) lines are left alone.
+_INTERN_MAX_LEN = 40
+
+_NAME_RE = re.compile(r"[A-Za-z,&' \-]{3,}")
+_COOKIE_HEADER_RE = re.compile(r"(?im)^\s*cookie\s*:\s*(.+)$")
+_HAS_DIGIT = re.compile(r"\d").search
+
+_NAME_SEL = CSSSelector("div.student_name > h5")
+_YEAR_SEL = CSSSelector("div.student_year")
+_INFO_SEL = CSSSelector("div.student_info")
+_COLLEGE_SEL = CSSSelector("#college_select option[selected]")
+# Kept separate (not one union selector) so the desktop pager wins over the mobile one.
+_NEXT_SEL = CSSSelector("div.next > a")
+_NAV_NEXT_SEL = CSSSelector("nav .next a")
+# Fallback: href of the first <a> whose text starts with "next" (any case), evaluated inside libxml2
+_NEXT_TEXT_XPATH = etree.XPath(
+    "(//a[starts-with(translate(normalize-space(.), 'NEXT', 'next'), 'next')])[1]/@href"
 )
 
 # ---------- Logging ----------
@@ -43,34 +103,26 @@ logging.basicConfig(
 # ---------- Helpers ----------
 
 def _parse_cookie_file(path: str) -> str:
-    import re
     txt = open(path, "r", encoding="utf-8").read().strip()
     if not txt:
         raise RuntimeError(f"{path} is empty")
 
-    m = re.search(r"(?im)^\s*cookie\s*:\s*(.+)$", txt)
+    m = _COOKIE_HEADER_RE.search(txt)
     if m:
         return m.group(1).strip()
 
-    if "\t" in txt and "\n" in txt:
-        pairs = []
-        for line in txt.splitlines():
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            parts = line.split("\t")
-            if len(parts) >= 7:
-                name, value = parts[5], parts[6]
-                if name and value:
-                    pairs.append(f"{name}={value}")
-        if pairs:
-            return "; ".join(pairs)
-
-    lines = [ln.strip() for ln in txt.splitlines() if ln.strip()]
+    lines = [ln for ln in (raw.strip() for raw in txt.splitlines()) if ln and not ln.startswith("#")]
+
+    # Netscape cookies.txt export: name and value are the 6th and 7th tab-separated fields
+    fields = [ln.split("\t") for ln in lines if "\t" in ln]
+    pairs = [f"{f[5]}={f[6]}" for f in fields if len(f) >= 7 and f[5] and f[6]]
+    if pairs:
+        return "; ".join(pairs)
+
     if len(lines) > 1 and all("=" in ln for ln in lines):
         return "; ".join(lines)
 
-    return txt.strip()
+    return txt
 
 
 def load_cookie_string(env_var: str, cookies_file: Optional[str]) -> str:
@@ -86,8 +138,11 @@ def load_cookie_string(env_var: str, cookies_file: Optional[str]) -> str:
     return s.strip()
 
 
-def get_session(cookies_str: str) -> requests.Session:
+def get_session(cookies_str: str, pool_size: int = 16) -> requests.Session:
     session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=HTTP_RETRY)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
     for pair in cookies_str.split(";"):
         pair = pair.strip()
         if not pair or "=" not in pair:
@@ -103,33 +158,48 @@ def get_session(cookies_str: str) -> requests.Session:
     })
     return session
 
-def fetch(session: requests.Session, url: str, retries: int = 3, backoff: float = 1.5) -> Optional[requests.Response]:
-    for attempt in range(1, retries + 1):
-        try:
-            r = session.get(url, timeout=20)
-            if r.status_code == 200:
-                return r
-            logging.warning(f"Fetch attempt {attempt} got HTTP {r.status_code} for {url}")
-            if r.status_code in (403, 401):
-                return r
-        except requests.RequestException as e:
-            logging.warning(f"Fetch attempt {attempt} failed: {e}")
-        time.sleep(backoff ** attempt)
+def fetch(session: requests.Session, url: str, headers: Optional[Dict[str, str]] = None) -> Optional[requests.Response]:
+    # Retries and their waits happen in the session's HTTPAdapter (see HTTP_RETRY)
+    try:
+        r = session.get(url, headers=headers, timeout=20)
+    except requests.RequestException as e:
+        logging.warning(f"Fetch failed for {url}: {e}")
+        return None
+    if r.status_code in (200, 304, 401, 403):
+        return r
+    logging.warning(f"Got HTTP {r.status_code} for {url}")
     return None
 
-def find_college_name(html: str) -> str:
-    soup = BeautifulSoup(html, "lxml")
-    sel = soup.select_one("#college_select option[selected]")
-    return sel.get_text(strip=True) if sel else "Unknown"
+def find_college_name(root: HtmlElement) -> str:
+    sel = _COLLEGE_SEL(root)
+    return sel[0].text_content().strip() if sel else "Unknown"
 
-def get_next_page_url(html: str) -> Optional[str]:
-    soup = BeautifulSoup(html, "lxml")
-    nxt = soup.select_one("div.next > a") or soup.select_one("nav .next a")
-    if not nxt:
-        nxt = next((a for a in soup.find_all("a") if a.get_text(strip=True).lower().startswith("next")), None)
-    return nxt["href"] if (nxt and nxt.has_attr("href")) else None
+def get_next_page_url(root: HtmlElement) -> Optional[str]:
+    nxt = _NEXT_SEL(root) or _NAV_NEXT_SEL(root)
+    if nxt:
+        return nxt[0].get("href")
+    href = _NEXT_TEXT_XPATH(root)
+    return href[0] if href else None
 
-def parse_student_card(card: Tag, page_college: str) -> Dict[str, Optional[str]]:
+def looks_like_birthday(s: str) -> bool:
+    parts = s.replace(".", "").split()
+    return len(parts) >= 1 and parts[0][:3] in MONTHS
+
+def looks_like_address(s: str) -> bool:
+    return "/" in s or _HAS_DIGIT(s) is not None
+
+def _info_lines(info: HtmlElement) -> List[str]:
+    # <br> carries no text, so each line arrives as its own text/tail node;
+    # reading them straight off the tree avoids rewriting or re-serializing it.
+    lines: List[str] = []
+    for text in info.itertext():
+        for ln in text.split("\n"):
+            ln = ln.strip()
+            if ln:
+                lines.append(sys.intern(ln) if len(ln) < _INTERN_MAX_LEN else ln)
+    return lines
+
+def parse_student_card(card: HtmlElement, page_college: Optional[str], scraped_at: str) -> Dict[str, Optional[str]]:
     rec: Dict[str, Optional[str]] = {
         "name": None,
         "college": page_college,
@@ -137,131 +207,339 @@ def parse_student_card(card: Tag, page_college: str) -> Dict[str, Optional[str]]
         "major": None,
         "bio": None,
         "source_url": None,
-        "scraped_at": datetime.utcnow().isoformat(),
+        "scraped_at": scraped_at,
     }
 
     # Name
-    name_tag = card.select_one("div.student_name > h5")
-    if name_tag:
-        rec["name"] = name_tag.get_text(strip=True)
+    name_tags = _NAME_SEL(card)
+    if name_tags:
+        rec["name"] = name_tags[0].text_content().strip()
 
     # Year: '27 or ’27
-    year_tag = card.select_one("div.student_year")
-    if year_tag:
-        rec["class_year"] = year_tag.get_text(strip=True).lstrip("’'")
+    year_tags = _YEAR_SEL(card)
+    if year_tags:
+        rec["class_year"] = year_tags[0].text_content().strip().lstrip("’'")
 
     lines: List[str] = []
-    for info in card.select("div.student_info"):
-        for br in info.find_all("br"):
-            br.replace_with("\n")
-        text = info.get_text("\n", strip=True)
-        if text:
-            lines.extend(ln.strip() for ln in text.split("\n") if ln.strip())
+    for info in _INFO_SEL(card):
+        lines.extend(_info_lines(info))
 
     if not lines:
         return rec
 
-    # helpers
-    MONTHS = {"Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"}
-    def looks_like_birthday(s: str) -> bool:
-        parts = s.replace(".", "").split()
-        return len(parts) >= 1 and parts[0][:3] in MONTHS
-    def looks_like_address(s: str) -> bool:
-        return any(ch.isdigit() for ch in s) or "/" in s
-
-    for i, ln in enumerate(list(lines)):
+    # One pass: the first college line wins, everything else that isn't an address may be the major
+    college_idx = -1
+    candidates_idx: List[int] = []
+    for i, ln in enumerate(lines):
         if ln in COLLEGE_NAMES:
-            rec["college"] = ln
-            del lines[i]
-            break
-
-    if lines and looks_like_birthday(lines[-1]):
-        lines.pop()
+            if college_idx < 0:
+                college_idx = i
+                rec["college"] = ln
+        elif not looks_like_address(ln):
+            candidates_idx.append(i)
+
+    # Birthday is the last line once the college line is set aside
+    bday_idx = len(lines) - 1
+    if bday_idx == college_idx:
+        bday_idx -= 1
+    if bday_idx < 0 or not looks_like_birthday(lines[bday_idx]):
+        bday_idx = -1
 
     major = None
-    candidates = [ln for ln in lines if not looks_like_address(ln) and ln not in COLLEGE_NAMES]
-    for ln in reversed(candidates):
+    for i in reversed(candidates_idx):
+        if i == bday_idx:
+            continue
+        ln = lines[i]
         if ln.lower() == "undeclared":
             major = "Undeclared"
             break
-        if MAJOR_KEYWORDS.search(ln) or re.fullmatch(r"[A-Za-z,&' \-]{3,}", ln):
+        # Either test accepts the line; the anchored name pattern is far cheaper and
+        # settles most lines, so the keyword alternation only runs on what it rejects.
+        if _NAME_RE.fullmatch(ln) or MAJOR_KEYWORDS.search(ln):
             major = ln
             break
     rec["major"] = major
 
-    bio_lines = [ln for ln in lines if ln != major] if major else lines
+    bio_lines = [ln for i, ln in enumerate(lines) if i != college_idx and i != bday_idx and ln != major]
     rec["bio"] = "; ".join(bio_lines) if bio_lines else None
 
     return rec
 
-def parse_directory_page(html: str, college: str, debug_n: int = 0) -> List[Dict[str, Optional[str]]]:
-    soup = BeautifulSoup(html, "lxml")
-    cards = soup.select("div.student_container")
-    results: List[Dict[str, Optional[str]]] = []
-    for idx, card in enumerate(cards):
-        rec = parse_student_card(card, college)
-        results.append(rec)
-        if debug_n and idx < debug_n:
-            info_tag = card.select_one("div.student_info")
-            if info_tag:
-                for br in info_tag.find_all("br"):
-                    br.replace_with("\n")
-                dbg = [ln.strip() for ln in info_tag.get_text("\n", strip=True).split("\n") if ln.strip()]
+def _is_card(elem: HtmlElement) -> bool:
+    return elem.tag == "div" and "student_container" in (elem.get("class") or "").split()
+
+def parse_directory_page(html: str, source_url: str, page: Dict[str, Optional[str]], debug_n: int = 0) -> Iterator[Dict[str, Optional[str]]]:
+    # Streams one record per card; once exhausted, page["college"] and page["next"] are filled in
+    parser = etree.HTMLPullParser(events=("end",), tag=("div", "select"))
+    parser.set_element_class_lookup(lxml_html.HtmlElementClassLookup())
+    scraped_at = datetime.utcnow().isoformat()
+    # Cards default to the page college, but its <select> may come after them: until it has
+    # been parsed, records are held back and those without a college line are stamped later
+    page["college"] = None
+    held: List[Dict[str, Optional[str]]] = []
+    idx = 0
+    prev_card: Optional[HtmlElement] = None
+
+    def release() -> Iterator[Dict[str, Optional[str]]]:
+        for rec in held:
+            if rec["college"] is None:
+                rec["college"] = page["college"]
+        yield from held
+        held.clear()
+
+    def drain() -> Iterator[Dict[str, Optional[str]]]:
+        nonlocal idx, prev_card
+        for _, elem in parser.read_events():
+            if elem.tag == "select":
+                if page["college"] is None and _COLLEGE_SEL(elem):
+                    page["college"] = find_college_name(elem)
+                    yield from release()
+                continue
+            if not _is_card(elem):
+                continue
+            rec = parse_student_card(elem, page["college"], scraped_at)
+            rec["source_url"] = source_url
+            if debug_n and idx < debug_n:
+                info_tags = _INFO_SEL(elem)
+                dbg = _info_lines(info_tags[0]) if info_tags else []
+                logging.info(f"[DEBUG] {rec.get('name')}: lines={dbg} -> major={rec.get('major')}")
+            idx += 1
+            # Empty this card and detach the one handled before it (clear() also drops the
+            # class, hence the reference); the rest of the page stays for the next-link lookup.
+            elem.clear(keep_tail=True)
+            if prev_card is not None and prev_card.getparent() is not None:
+                prev_card.getparent().remove(prev_card)
+            prev_card = elem
+            if page["college"] is None:
+                held.append(rec)
             else:
-                dbg = []
-            logging.info(f"[DEBUG] {rec.get('name')}: lines={dbg} -> major={rec.get('major')}")
-    return results
+                yield rec
+
+    for start in range(0, len(html), FEED_CHUNK_SIZE):
+        parser.feed(html[start:start + FEED_CHUNK_SIZE])
+        yield from drain()
+    root = parser.close()
+    yield from drain()
+    if page["college"] is None:
+        page["college"] = "Unknown"
+        yield from release()
+    page["next"] = get_next_page_url(root)
+
+def open_writer(out_path: str) -> Tuple[TextIO, Any]:
+    f = open(out_path, "w", newline="", encoding="utf-8")
+    writer = csv.writer(f)
+    writer.writerow(FIELDNAMES)
+    return f, writer
+
+def open_page_cache(path: str) -> sqlite3.Connection:
+    # Scoped by start URL: the same currentIndex=K shows a different college per start page
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS pages ("
+        "scope TEXT NOT NULL, url TEXT NOT NULL, etag TEXT, last_mod TEXT, next_url TEXT, "
+        "parsed_blob TEXT NOT NULL, PRIMARY KEY (scope, url))"
+    )
+    return conn
+
+def _cached_headers(cache: Optional[sqlite3.Connection], scope: str, url: str) -> Dict[str, str]:
+    if cache is None:
+        return {}
+    row = cache.execute("SELECT etag, last_mod FROM pages WHERE scope = ? AND url = ?", (scope, url)).fetchone()
+    headers: Dict[str, str] = {}
+    if row and row[0]:
+        headers["If-None-Match"] = row[0]
+    if row and row[1]:
+        headers["If-Modified-Since"] = row[1]
+    return headers
+
+def _load_cached_page(cache: sqlite3.Connection, scope: str, url: str) -> Optional[Tuple[Optional[str], List[Dict[str, Optional[str]]]]]:
+    row = cache.execute("SELECT next_url, parsed_blob FROM pages WHERE scope = ? AND url = ?", (scope, url)).fetchone()
+    return (row[0], json.loads(row[1])) if row else None
+
+def _store_cached_page(cache: sqlite3.Connection, scope: str, url: str, etag: Optional[str], last_mod: Optional[str], next_url: Optional[str], records: List[Dict[str, Optional[str]]]) -> None:
+    with cache:
+        cache.execute(
+            "INSERT OR REPLACE INTO pages (scope, url, etag, last_mod, next_url, parsed_blob) VALUES (?, ?, ?, ?, ?, ?)",
+            (scope, url, etag, last_mod, next_url, json.dumps(records)),
+        )
 
-def write_csv(records: List[Dict[str, Optional[str]]], out_path: str) -> None:
-    if not records:
-        logging.warning("No records to write")
-        return
-    fieldnames = ["name","college","class_year","major","bio","source_url","scraped_at"]
-    with open(out_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(records)
-    logging.info(f"Wrote {len(records)} records to {out_path}")
-
-def scrape_directory(session: requests.Session, start_url: str, max_pages: Optional[int], delay: float, debug_save: bool, debug_print: int) -> List[Dict[str, Optional[str]]]:
-    records: List[Dict[str, Optional[str]]] = []
-    current_url = start_url
+def _make_throttle(delay: float, stop: threading.Event) -> Callable[[], None]:
+    # Spaces request starts `delay` apart across threads; waiters return early once `stop` is set
+    lock = threading.Lock()
+    next_slot = [0.0]
+
+    def throttle() -> None:
+        with lock:
+            now = time.monotonic()
+            slot = max(now, next_slot[0])
+            next_slot[0] = slot + max(0.0, float(delay))
+        stop.wait(slot - now)
+
+    return throttle
+
+def _page_index(url: str) -> Optional[int]:
+    try:
+        return int(parse_qs(urlparse(url).query)["currentIndex"][0])
+    except (KeyError, ValueError):
+        return None
+
+def _with_page_index(url: str, index: int) -> str:
+    parts = urlparse(url)
+    query = parse_qs(parts.query, keep_blank_values=True)
+    query["currentIndex"] = [str(index)]
+    return urlunparse(parts._replace(query=urlencode(query, doseq=True)))
+
+def scrape_directory(session: requests.Session, start_url: str, out_file: TextIO, writer: Any, max_pages: Optional[int], delay: float, debug_save: bool, debug_print: int, workers: int = 8, cache: Optional[sqlite3.Connection] = None) -> int:
+    # With a cache, pages are requested conditionally and a 304 reuses the stored records
+    written = 0
+    stop = threading.Event()
+    throttle = _make_throttle(delay, stop)
     pages_scraped = 0
-    while current_url:
-        logging.info(f"Fetching {current_url}")
-        resp = fetch(session, current_url)
+
+    def get(url: str, headers: Dict[str, str]) -> Optional[requests.Response]:
+        throttle()
+        if stop.is_set():
+            return None
+        logging.info(f"Fetching {url}")
+        return fetch(session, url, headers=headers)
+
+    def scrape_page(url: str, resp: Optional[requests.Response]) -> Tuple[Optional[str], int]:
+        # Returns (absolute next-page URL, cards on the page)
+        nonlocal pages_scraped, written
         if not resp:
-            logging.warning(f"Failed to fetch {current_url}")
-            break
+            logging.warning(f"Failed to fetch {url}")
+            return None, 0
         if resp.status_code == 302:
             logging.error("Redirected to login — cookies likely expired. Recopy cookies and try again.")
-            break
-        html = resp.text
-        current_url = resp.url  
-
-        if debug_save:
-            with open(f"debug_page_{pages_scraped:03d}.html", "w", encoding="utf-8") as f:
-                f.write(html)
-
-        college_name = find_college_name(html)
-        page_records = parse_directory_page(html, college_name, debug_n=debug_print)
-        for rec in page_records:
-            rec["source_url"] = current_url
-        records.extend(page_records)
+            return None, 0
+        if resp.status_code == 304 and cache is not None:
+            cached = _load_cached_page(cache, start_url, url)
+            if cached is None:
+                logging.warning(f"{url} not modified but missing from the page cache")
+                return None, 0
+            next_url, page_records = cached
+            # This run is the one that confirmed the page, so stamp the rows as such
+            scraped_at = datetime.utcnow().isoformat()
+            for rec in page_records:
+                rec["source_url"] = resp.url
+                rec["scraped_at"] = scraped_at
+            writer.writerows(map(_record_row, page_records))
+            n_cards = len(page_records)
+            logging.info(f"{url} not modified; reused {n_cards} cached records")
+        else:
+            html = resp.text
+            page_url = resp.url
+
+            if debug_save:
+                with open(f"debug_page_{pages_scraped:03d}.html", "w", encoding="utf-8") as f:
+                    f.write(html)
+
+            etag, last_mod = resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+            # Only pages the server can later confirm as unchanged are worth keeping
+            keep: Optional[List[Dict[str, Optional[str]]]] = [] if cache is not None and (etag or last_mod) else None
+            page: Dict[str, Optional[str]] = {}
+            n_cards = 0
+            for rec in parse_directory_page(html, page_url, page, debug_n=debug_print):
+                writer.writerow(_record_row(rec))
+                n_cards += 1
+                if keep is not None:
+                    keep.append(rec)
+            next_url = urljoin(page_url, page["next"]) if page["next"] else None
+            if keep is not None and resp.status_code == 200:
+                _store_cached_page(cache, start_url, url, etag, last_mod, next_url, keep)
+        written += n_cards
 
         pages_scraped += 1
+        if pages_scraped % FLUSH_EVERY_PAGES == 0:
+            out_file.flush()
         if max_pages is not None and pages_scraped >= max_pages:
             logging.info(f"Reached max-pages = {max_pages}")
-            break
+            return None, n_cards
 
-        next_rel = get_next_page_url(html)
-        if next_rel:
-            current_url = urljoin(current_url, next_rel)
-            time.sleep(max(0.0, float(delay)))
-        else:
+        if not next_url:
             logging.info("No further pages found")
-            break
-    return records
+            return None, n_cards
+        return next_url, n_cards
+
+    # The first page is fetched on its own: its "next" link tells us how currentIndex advances.
+    current_url: Optional[str] = start_url
+    step = None
+    while current_url:
+        page_url = current_url
+        current_url, n_cards = scrape_page(page_url, get(page_url, _cached_headers(cache, start_url, page_url)))
+        if current_url and workers > 1:
+            next_index = _page_index(current_url)
+            if next_index is not None:
+                prev_index = _page_index(page_url)
+                step = next_index - prev_index if prev_index is not None else n_cards
+                if step > 0:
+                    break
+
+    # Later pages are just currentIndex offsets, so keep up to `workers` of them in flight and
+    # parse them in order. A fetched page with fewer than `step` cards is probably the last one,
+    # so nothing past it is requested until a parsed page up to it turns out to link onward.
+    if current_url and step:
+        offset_url = current_url
+        first_index = _page_index(offset_url)
+        limit = max_pages - pages_scraped if max_pages is not None else None
+        pending: Deque[Tuple[int, str, Future]] = deque()
+        submitted = 0
+        end_lock = threading.Lock()
+        last_index: List[Optional[int]] = [None]
+
+        def past_end(index: int) -> bool:
+            return last_index[0] is not None and index > last_index[0]
+
+        def get_offset(url: str, headers: Dict[str, str], index: int) -> Tuple[bool, Optional[requests.Response]]:
+            if past_end(index):
+                return False, None
+            resp = get(url, headers)
+            # Counting card markers in the raw text is cheap and can only over-count
+            if resp is not None and resp.status_code == 200 and resp.text.count("student_container") < step:
+                with end_lock:
+                    if last_index[0] is None or index < last_index[0]:
+                        last_index[0] = index
+            return True, resp
+
+        def submit(ex: ThreadPoolExecutor) -> None:
+            nonlocal submitted
+            index = first_index + submitted * step
+            url = _with_page_index(offset_url, index)
+            # Cache lookups stay on this thread; sqlite connections aren't shared across threads
+            pending.append((index, url, ex.submit(get_offset, url, _cached_headers(cache, start_url, url), index)))
+            submitted += 1
+
+        def can_submit() -> bool:
+            return (limit is None or submitted < limit) and not past_end(first_index + submitted * step)
+
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            while len(pending) < workers and can_submit():
+                submit(ex)
+            while pending:
+                index, url, future = pending.popleft()
+                fetched, resp = future.result()
+                if not fetched:
+                    # Skipped on a short page that has since been parsed and linked onward
+                    resp = get(url, _cached_headers(cache, start_url, url))
+                current_url, n_cards = scrape_page(url, resp)
+                if not current_url or not n_cards:
+                    stop.set()
+                    for _, _, queued in pending:
+                        queued.cancel()
+                    break
+                # This page links onward, so no page up to it was the last one
+                with end_lock:
+                    if last_index[0] is not None and last_index[0] <= index:
+                        last_index[0] = None
+                while len(pending) < workers and can_submit():
+                    submit(ex)
+        stop.clear()
+
+    # Anything the offset window didn't reach (an empty page that still links onward) is walked in order
+    while current_url:
+        page_url = current_url
+        current_url, _ = scrape_page(page_url, get(page_url, _cached_headers(cache, start_url, page_url)))
+    return written
 
 def main(argv: Optional[Iterable[str]] = None) -> int:
     p = argparse.ArgumentParser(description="Scrape Yale Facebook card view (/facebook/PhotoPageNew).")
@@ -269,10 +547,12 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
     p.add_argument("--college", default=None, help="Residential college to switch to before scraping (e.g. 'Pierson College')")
     p.add_argument("--start", dest="start_url", default=None, help="Start URL (defaults to /facebook/PhotoPageNew?currentIndex=0)")
     p.add_argument("--max-pages", type=int, default=None, help="Maximum number of pages to scrape")
-    p.add_argument("--delay", type=float, default=1.0, help="Delay (seconds) between pages")
+    p.add_argument("--delay", type=float, default=1.0, help="Minimum delay (seconds) between page request starts, shared by all workers; lower it for --workers to speed things up")
+    p.add_argument("--workers", type=int, default=8, help="Concurrent page fetches once pagination offsets are known")
     p.add_argument("--cookies-file", default=None, help="Path to a file containing the Cookie header value")
     p.add_argument("--debug-save", action="store_true", help="Save each fetched page to debug_page_###.html")
     p.add_argument("--debug-print", type=int, default=0, help="Print parsed info lines for first N cards per page")
+    p.add_argument("--cache-db", default=None, help="sqlite file caching parsed pages between runs (e.g. scrape_cache.sqlite)")
 
     args = p.parse_args(argv)
 
@@ -282,7 +562,7 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
         logging.error(str(e))
         return 1
 
-    session = get_session(cookie_str)
+    session = get_session(cookie_str, pool_size=max(1, args.workers))
 
     if args.start_url:
         start_url = urljoin(BASE_URL, args.start_url)
@@ -292,8 +572,23 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
         else:
             start_url = urljoin(BASE_URL, "/facebook/PhotoPageNew?currentIndex=0")
 
-    records = scrape_directory(session, start_url, max_pages=args.max_pages, delay=args.delay, debug_save=args.debug_save, debug_print=args.debug_print)
-    write_csv(records, args.out)
+    # Rows stream into a side file that only replaces --out once something was scraped, so a
+    # failed run (expired cookies, no network) leaves the previous output untouched.
+    part_path = args.out + ".part"
+    cache = open_page_cache(args.cache_db) if args.cache_db else None
+    out_file, writer = open_writer(part_path)
+    try:
+        with out_file:
+            written = scrape_directory(session, start_url, out_file, writer, max_pages=args.max_pages, delay=args.delay, debug_save=args.debug_save, debug_print=args.debug_print, workers=args.workers, cache=cache)
+    finally:
+        if cache is not None:
+            cache.close()
+    if not written:
+        os.remove(part_path)
+        logging.warning("No records to write")
+        return 0
+    os.replace(part_path, args.out)
+    logging.info(f"Wrote {written} records to {args.out}")
     return 0
 
 if __name__ == "__main__":